@@ -4,6 +4,119 @@ Lab 1.
 Language detection
 """
 # pylint:disable=too-many-locals, unused-argument, unused-variable
+from typing import Iterable, Iterator
+
+
+class BinaryProfileFrequencies:
+    """
+    Read-only mapping of tokens to frequencies backed by a memory-mapped binary profile.
+
+    Tokens are looked up with a binary search over the sorted token block,
+    and frequencies are read from the float32 array on access, so the file pages
+    stay shared between processes instead of being copied into a dictionary
+
+    Attributes:
+        _path_to_file (str): A path to the binary language profile
+        _mapping (mmap.mmap | None): A read-only memory map of the binary profile
+        _tokens_count (int): A number of tokens in the profile
+        _offsets_start (int): A position of the token offsets in the file
+        _frequencies_start (int): A position of the frequencies array in the file
+    """
+
+    def __init__(self, path_to_file: str) -> None:
+        """
+        Initialize an instance of BinaryProfileFrequencies.
+
+        Args:
+            path_to_file (str): A path to the binary language profile
+        """
+
+    def __getitem__(self, token: str) -> float:
+        """
+        Get a frequency of a token.
+
+        Args:
+            token (str): A token to look up
+
+        Returns:
+            float: The frequency of the token
+
+        Raises:
+            KeyError: If the token is absent from the profile
+        """
+
+    def __contains__(self, token: object) -> bool:
+        """
+        Check whether a token is present in the profile.
+
+        Args:
+            token (object): A token to look up
+
+        Returns:
+            bool: True if the token is present
+        """
+
+    def __len__(self) -> int:
+        """
+        Get a number of tokens in the profile.
+
+        Returns:
+            int: The number of tokens
+        """
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over tokens in sorted order, decoding them lazily.
+
+        Yields:
+            str: A token of the profile
+        """
+
+    def get(self, token: str, default: float | None = None) -> float | None:
+        """
+        Get a frequency of a token or a default value.
+
+        Args:
+            token (str): A token to look up
+            default (float | None): A value returned for absent tokens
+
+        Returns:
+            float | None: The frequency of the token or the default value
+        """
+
+    def keys(self) -> Iterator[str]:
+        """
+        Iterate over tokens in sorted order.
+
+        Returns:
+            Iterator[str]: An iterator over tokens
+        """
+
+    def items(self) -> Iterator[tuple[str, float]]:
+        """
+        Iterate over tokens and their frequencies in sorted order.
+
+        Returns:
+            Iterator[tuple[str, float]]: An iterator over pairs of a token and a frequency
+        """
+
+    def __reduce__(self) -> tuple[type, tuple[str]]:
+        """
+        Pickle the mapping as the path to its file instead of the memory map.
+
+        A memory map cannot be pickled, so an unpickled copy, e.g. in a worker process
+        started with the spawn method, maps the file by itself and shares its pages
+        with other processes mapping the same file
+
+        Returns:
+            tuple[type, tuple[str]]: The class and the path to the binary profile
+                to initialize the copy with
+        """
+
+    def close(self) -> None:
+        """
+        Release the memory map.
+        """
 
 
 def tokenize(text: str) -> list[str] | None:
@@ -36,6 +149,84 @@ def calculate_frequencies(tokens: list[str] | None) -> dict[str, float] | None:
     """
 
 
+def read_text_chunks(path_to_file: str, chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Read a text file lazily in chunks of a fixed size.
+
+    Args:
+        path_to_file (str): A path to the text file
+        chunk_size (int): A maximum number of characters in a chunk
+
+    Yields:
+        str: A chunk of the text
+
+    In case of corrupt input arguments, nothing is yielded
+    """
+
+
+def tokenize_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split a stream of text chunks into tokens lazily.
+
+    Tokens are produced the same way as by tokenize, so that tokenizing
+    the concatenation of the chunks yields the same sequence
+
+    Args:
+        chunks (Iterable[str]): An iterable of text chunks
+
+    Yields:
+        str: A lower-cased token without punctuation
+
+    In case of corrupt input arguments, nothing is yielded
+    """
+
+
+def update_counts(tokens: Iterable[str], counts: dict[str, int]) -> dict[str, int] | None:
+    """
+    Update absolute token counts in place with tokens from a stream.
+
+    Args:
+        tokens (Iterable[str]): An iterable of tokens
+        counts (dict[str, int]): A dictionary with absolute counts to update
+
+    Returns:
+        dict[str, int] | None: The updated dictionary with absolute counts
+
+    In case of corrupt input arguments, None is returned
+    """
+
+
+def merge_counts(
+    first_counts: dict[str, int], second_counts: dict[str, int]
+) -> dict[str, int] | None:
+    """
+    Merge two partial dictionaries with absolute counts.
+
+    Args:
+        first_counts (dict[str, int]): A dictionary with absolute counts
+        second_counts (dict[str, int]): A dictionary with absolute counts
+
+    Returns:
+        dict[str, int] | None: A new dictionary with summed counts
+
+    In case of corrupt input arguments, None is returned
+    """
+
+
+def counts_to_frequencies(counts: dict[str, int]) -> dict[str, float] | None:
+    """
+    Convert absolute token counts into relative frequencies.
+
+    Args:
+        counts (dict[str, int]): A dictionary with absolute counts
+
+    Returns:
+        dict[str, float] | None: A dictionary with frequencies
+
+    In case of corrupt input arguments or empty counts, None is returned
+    """
+
+
 def create_language_profile(language: str, text: str) -> dict[str, str | dict[str, float]] | None:
     """
     Create a language profile.
@@ -51,6 +242,25 @@ def create_language_profile(language: str, text: str) -> dict[str, str | dict[st
     """
 
 
+def create_language_profile_from_file(
+    language: str, path_to_file: str, chunk_size: int = 65536
+) -> dict[str, str | dict[str, float]] | None:
+    """
+    Create a language profile from a text file without loading it into memory.
+
+    Args:
+        language (str): A language
+        path_to_file (str): A path to the text file
+        chunk_size (int): A maximum number of characters read at once
+
+    Returns:
+        dict[str, str | dict[str, float]] | None: A dictionary with two keys – name, freq
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
+
 def calculate_mse(predicted: list, actual: list) -> float | None:
     """
     Calculate mean squared error between predicted and actual values.
@@ -67,16 +277,20 @@ def calculate_mse(predicted: list, actual: list) -> float | None:
 
 
 def compare_profiles(
-    unknown_profile: dict[str, str | dict[str, float]],
-    profile_to_compare: dict[str, str | dict[str, float]],
+    unknown_profile: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
+    profile_to_compare: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
 ) -> float | None:
     """
     Compare profiles and calculate the distance using symbols.
 
+    Frequencies of a profile are either a dictionary or a BinaryProfileFrequencies
+    mapping of a profile loaded by load_binary_profile
+
     Args:
-        unknown_profile (dict[str, str | dict[str, float]]): A dictionary of an unknown profile
-        profile_to_compare (dict[str, str | dict[str, float]]): A dictionary of a profile
-            to compare the unknown profile to
+        unknown_profile (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of an unknown profile
+        profile_to_compare (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of a profile to compare the unknown profile to
 
     Returns:
         float | None: The distance between the profiles
@@ -111,6 +325,9 @@ def load_profile(path_to_file: str) -> dict | None:
     """
     Load a language profile.
 
+    Profiles with the .bin extension are loaded with load_binary_profile,
+    other files are read as JSON
+
     Args:
         path_to_file (str): A path to the language profile
 
@@ -121,6 +338,60 @@ def load_profile(path_to_file: str) -> dict | None:
     """
 
 
+def save_binary_profile(profile: dict[str, str | dict[str, float]], path_to_file: str) -> None:
+    """
+    Save a preprocessed language profile in a compact binary format.
+
+    The file consists of a header with the language name and the number of tokens,
+    a block of sorted UTF-8 encoded tokens with their offsets and
+    an array of float32 frequencies aligned with the tokens
+
+    Args:
+        profile (dict[str, str | dict[str, float]]): A preprocessed profile
+        path_to_file (str): A path to the binary file to create
+
+    In case of corrupt input arguments, nothing is saved
+    """
+
+
+def convert_json_profile(path_to_json: str, path_to_binary: str) -> None:
+    """
+    Convert a JSON language profile into the binary format.
+
+    The profile is loaded and preprocessed before saving,
+    so the binary file contains relative frequencies of unigrams only
+
+    Args:
+        path_to_json (str): A path to the JSON language profile
+        path_to_binary (str): A path to the binary file to create
+
+    In case of corrupt input arguments or functions used return None,
+    nothing is saved
+    """
+
+
+def load_binary_profile(
+    path_to_file: str,
+) -> dict[str, str | BinaryProfileFrequencies] | None:
+    """
+    Load a binary language profile via memory mapping.
+
+    Only the header is parsed: frequencies are exposed as a BinaryProfileFrequencies
+    mapping over the read-only file, so processes loading the same profile
+    share its pages for as long as the mapping is used. Converting the mapping
+    into a dictionary copies the data and ends the sharing
+
+    Args:
+        path_to_file (str): A path to the binary language profile
+
+    Returns:
+        dict[str, str | BinaryProfileFrequencies] | None: A dictionary with
+            two keys – name, freq
+
+    In case of corrupt input arguments or a malformed file, None is returned
+    """
+
+
 def preprocess_profile(profile: dict) -> dict[str, str | dict] | None:
     """
     Preprocess profile for a loaded language.
@@ -137,30 +408,39 @@ def preprocess_profile(profile: dict) -> dict[str, str | dict] | None:
     """
 
 
-def collect_profiles(paths_to_profiles: list) -> list[dict[str, str | dict[str, float]]] | None:
+def collect_profiles(
+    paths_to_profiles: list,
+) -> list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]] | None:
     """
     Collect profiles for a given path.
 
+    Binary profiles are already preprocessed, so only JSON profiles
+    are passed to preprocess_profile, frequencies of binary profiles
+    stay BinaryProfileFrequencies mappings
+
     Args:
         paths_to_profiles (list): A list of strings to the profiles
 
     Returns:
-        list[dict[str, str | dict[str, float]]] | None: A list of loaded profiles
+        list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]] | None:
+            A list of loaded profiles
 
     In case of corrupt input arguments, None is returned
     """
 
 
 def detect_language_advanced(
-    unknown_profile: dict[str, str | dict[str, float]], known_profiles: list
+    unknown_profile: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
+    known_profiles: list,
 ) -> list | None:
     """
     Detect the language of an unknown profile.
 
     Args:
-        unknown_profile (dict[str, str | dict[str, float]]): A dictionary of a profile
-            to determine the language of
-        known_profiles (list): A list of known profiles
+        unknown_profile (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of a profile to determine the language of
+        known_profiles (list): A list of known profiles with frequencies
+            stored in dictionaries or BinaryProfileFrequencies mappings
 
     Returns:
         list | None: A sorted list of tuples containing a language and a distance
@@ -169,6 +449,233 @@ def detect_language_advanced(
     """
 
 
+def compare_profiles_with_bound(
+    unknown_profile: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
+    profile_to_compare: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
+    bound: float,
+) -> float | None:
+    """
+    Compare profiles and stop as soon as the distance exceeds a bound.
+
+    Squared errors are accumulated over tokens of the unknown profile in descending
+    order of their frequency, then over the remaining tokens of the profile to compare.
+    Each partial sum is divided by the size of the union of tokens,
+    so it never decreases and can be checked against the bound at every step
+
+    Args:
+        unknown_profile (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of an unknown profile
+        profile_to_compare (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of a profile to compare the unknown profile to
+        bound (float): A distance above which the comparison is stopped
+
+    Returns:
+        float | None: The distance between the profiles equal to the one returned by
+            compare_profiles, or a partial distance greater than the bound
+
+    In case of corrupt input arguments or lack of keys 'name' and
+    'freq' in arguments, None is returned
+    """
+
+
+def rank_languages(
+    unknown_profile: dict[str, str | dict[str, float] | BinaryProfileFrequencies],
+    known_profiles: list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]],
+    top_k: int = 1,
+) -> list[tuple[str, float]] | None:
+    """
+    Find top-k languages closest to an unknown profile.
+
+    The distance of the current k-th best language is passed as a bound to
+    compare_profiles_with_bound, so profiles that are already worse are pruned early.
+    Profiles with a distance equal to the bound are kept to preserve ordering of ties
+
+    Args:
+        unknown_profile (dict[str, str | dict[str, float] | BinaryProfileFrequencies]):
+            A dictionary of a profile to determine the language of
+        known_profiles (list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]]):
+            A list of known profiles
+        top_k (int): A number of languages to return
+
+    Returns:
+        list[tuple[str, float]] | None: The first top_k tuples of the output of
+            detect_language_advanced, suitable for print_report
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
+
+def init_detection_worker(
+    known_profiles: list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]]
+) -> None:
+    """
+    Store known profiles in a worker process once, before it receives any texts.
+
+    The function is passed as the initializer of the pool created by
+    detect_language_batch, so profiles are pickled once per worker
+    instead of once per chunk. Binary profiles are pickled as paths
+    and mapped by every worker itself
+
+    Args:
+        known_profiles (list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]]):
+            A list of known profiles
+
+    In case of corrupt input arguments, nothing is stored
+    """
+
+
+def detect_language_chunk(texts: list[str]) -> list[list[tuple[str, float]]] | None:
+    """
+    Detect languages of a chunk of texts in a worker process.
+
+    The function is a unit of work sent to worker processes by detect_language_batch,
+    known profiles are taken from the ones stored by init_detection_worker
+
+    Args:
+        texts (list[str]): A chunk of texts
+
+    Returns:
+        list[list[tuple[str, float]]] | None: A list with one output of
+            detect_language_advanced per text
+
+    In case of corrupt input arguments, profiles not initialized
+    or functions used return None, None is returned
+    """
+
+
+def detect_language_batch(
+    texts: Iterable[str],
+    known_profiles: list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]],
+    processes: int | None = None,
+    chunk_size: int = 64,
+) -> list[list[tuple[str, float]]] | None:
+    """
+    Detect languages of many texts using a pool of worker processes.
+
+    Known profiles are sent to every worker once through init_detection_worker,
+    texts are split into chunks of chunk_size texts, only the texts are sent
+    to detect_language_chunk and results are returned in the order of texts
+
+    Args:
+        texts (Iterable[str]): An iterable of texts
+        known_profiles (list[dict[str, str | dict[str, float] | BinaryProfileFrequencies]]):
+            A list of known profiles
+        processes (int | None): A number of worker processes,
+            all available CPUs are used if None
+        chunk_size (int): A number of texts sent to a worker at once
+
+    Returns:
+        list[list[tuple[str, float]]] | None: A list with one sorted list of tuples
+            containing a language and a distance per text
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
+
+def build_profile_matrix(
+    known_profiles: list[dict[str, str | dict[str, float]]]
+) -> tuple[list[str], list[str], list[list[float]]] | None:
+    """
+    Pack known profiles into a dense matrix over a shared vocabulary.
+
+    The vocabulary is a sorted union of tokens of all profiles.
+    Each row of the matrix holds frequencies of one language,
+    a token missing in a profile gets a frequency of 0.0
+
+    Args:
+        known_profiles (list[dict[str, str | dict[str, float]]]): A list of profiles
+            returned by collect_profiles
+
+    Returns:
+        tuple[list[str], list[str], list[list[float]]] | None: A tuple with
+            a shared vocabulary, a list of language names and a matrix with
+            one row per language
+
+    In case of corrupt input arguments, None is returned
+    """
+
+
+def vectorize_profile(
+    profile: dict[str, str | dict[str, float]], vocabulary: list[str]
+) -> tuple[list[float], float, int] | None:
+    """
+    Project a profile onto a shared vocabulary.
+
+    Tokens of the profile that are absent from the vocabulary are not dropped silently:
+    the sum of squares of their frequencies and their number are returned as well,
+    as such tokens contribute to the distance to every known language
+
+    Args:
+        profile (dict[str, str | dict[str, float]]): A dictionary of a profile
+        vocabulary (list[str]): A shared vocabulary of a profile matrix
+
+    Returns:
+        tuple[list[float], float, int] | None: A list of frequencies aligned with
+            the vocabulary, a sum of squared frequencies of out-of-vocabulary tokens
+            and a number of out-of-vocabulary tokens
+
+    In case of corrupt input arguments, None is returned
+    """
+
+
+def calculate_mse_matrix(
+    unknown_vectors: list[list[float]],
+    out_of_vocabulary: list[tuple[float, int]],
+    profile_matrix: list[list[float]],
+) -> list[list[float]] | None:
+    """
+    Calculate MSE between every unknown vector and every row of a profile matrix.
+
+    For each pair, squared differences are summed over positions where at least one
+    of the compared values is non-zero, and the number of such positions is counted.
+    The out-of-vocabulary sum of squares and count of the unknown vector are added
+    to the numerator and the denominator respectively, so the positions cover
+    the union of tokens of both profiles and each score is equal to the one
+    returned by compare_profiles
+
+    Args:
+        unknown_vectors (list[list[float]]): A matrix with one vectorized
+            unknown profile per row
+        out_of_vocabulary (list[tuple[float, int]]): A sum of squared frequencies and
+            a number of out-of-vocabulary tokens per unknown vector, as returned by
+            vectorize_profile
+        profile_matrix (list[list[float]]): A matrix with one known language per row
+
+    Returns:
+        list[list[float]] | None: A matrix of scores, where a row corresponds to
+            an unknown vector and a column corresponds to a known language
+
+    In case of corrupt input arguments or mismatching vector lengths, None is returned
+    """
+
+
+def detect_language_matrix(
+    unknown_profiles: list[dict[str, str | dict[str, float]]],
+    known_profiles: list[dict[str, str | dict[str, float]]],
+) -> list[list[tuple[str, float]]] | None:
+    """
+    Detect languages of several unknown profiles in one pass over a profile matrix.
+
+    Unknown profiles are projected with vectorize_profile and scored with
+    calculate_mse_matrix, out-of-vocabulary tokens included, so each list
+    is identical to the output of detect_language_advanced
+
+    Args:
+        unknown_profiles (list[dict[str, str | dict[str, float]]]): A list of profiles
+            to determine the language of
+        known_profiles (list[dict[str, str | dict[str, float]]]): A list of known profiles
+
+    Returns:
+        list[list[tuple[str, float]]] | None: A list with one sorted list of tuples
+            containing a language and a distance per unknown profile
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
+
 def print_report(detections: list[tuple[str, float]]) -> None:
     """
     Print report for detection of language.
@@ -6,7 +6,7 @@ Extract keywords based on frequency related metrics
 
 # pylint:disable=unused-argument
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 def check_list(user_input: Any, elements_type: type, can_be_empty: bool) -> bool:
@@ -89,6 +89,63 @@ def remove_stop_words(tokens: list[str], stop_words: list[str]) -> list[str] | N
     """
 
 
+class TextNormalizer:
+    """
+    Clean, tokenize and filter texts with state prepared once.
+
+    Produces the same tokens as clean_and_tokenize followed by remove_stop_words.
+    An instance can be reused across documents and imported by later labs.
+
+    Attributes:
+        _punctuation_pattern (re.Pattern): Compiled pattern matching symbols to remove
+        _stop_words (frozenset[str]): Tokens to exclude
+    """
+
+    def __init__(self, stop_words: Iterable[str]) -> None:
+        """
+        Initialize an instance of TextNormalizer.
+
+        Args:
+            stop_words (Iterable[str]): Tokens to exclude
+        """
+
+    def clean_and_tokenize(self, text: str) -> list[str] | None:
+        """
+        Remove punctuation, convert to lowercase, and split into tokens.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            list[str] | None: A list of lowercase tokens without punctuation.
+            In case of corrupt input arguments, None is returned.
+        """
+
+    def remove_stop_words(self, tokens: list[str]) -> list[str] | None:
+        """
+        Exclude stop words from the token sequence with constant-time membership checks.
+
+        Args:
+            tokens (list[str]): Original token sequence
+
+        Returns:
+            list[str] | None: Token sequence without stop words.
+            In case of corrupt input arguments, None is returned.
+        """
+
+    def normalize(self, text: str) -> list[str] | None:
+        """
+        Clean, tokenize and filter a text in a single pass over its tokens.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            list[str] | None: A list of lowercase tokens without punctuation and stop words.
+            In case of corrupt input arguments, None is returned.
+        """
+
+
 def calculate_frequencies(tokens: list[str]) -> dict[str, int] | None:
     """
     Create a frequency dictionary from the token sequence.
@@ -117,6 +174,40 @@ def get_top_n(frequencies: dict[str, int | float], top: int) -> list[str] | None
     """
 
 
+def get_top_n_stream(scores: Iterable[tuple[str, int | float]], top: int) -> list[str] | None:
+    """
+    Extract the highest-scored tokens from a stream using a bounded heap.
+
+    Only top pairs are kept in memory. Tokens with equal scores are ordered
+    by their position in the stream, so the result matches get_top_n
+    for the items of the same dictionary.
+
+    Args:
+        scores (Iterable[tuple[str, int | float]]): Pairs of a token and its score
+        top (int): Number of tokens to extract
+
+    Returns:
+        list[str] | None: Top-N tokens sorted by score.
+        In case of corrupt input arguments, None is returned.
+    """
+
+
+def iterate_frequencies(tokens: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """
+    Count tokens of a stream and yield pairs of a token and its occurrences.
+
+    The token sequence is consumed once and never stored,
+    pairs are yielded after the stream is exhausted.
+
+    Args:
+        tokens (Iterable[str]): Token sequence
+
+    Yields:
+        tuple[str, int]: A token and its number of occurrences.
+        In case of corrupt input arguments, nothing is yielded.
+    """
+
+
 def calculate_tf(frequencies: dict[str, int]) -> dict[str, float] | None:
     """
     Calculate Term Frequency (TF) for each token.
@@ -144,6 +235,22 @@ def calculate_tfidf(term_freq: dict[str, float], idf: dict[str, float]) -> dict[
     """
 
 
+def iterate_tfidf(
+    term_freq: Iterable[tuple[str, float]], idf: dict[str, float]
+) -> Iterator[tuple[str, float]]:
+    """
+    Calculate TF-IDF scores lazily for a stream of term frequencies.
+
+    Args:
+        term_freq (Iterable[tuple[str, float]]): Pairs of a token and its TF value
+        idf (dict[str, float]): Inverse document frequency values
+
+    Yields:
+        tuple[str, float]: A token and its TF-IDF value.
+        In case of corrupt input arguments, nothing is yielded.
+    """
+
+
 def calculate_expected_frequency(
     doc_freqs: dict[str, int], corpus_freqs: dict[str, int]
 ) -> dict[str, float] | None:
@@ -190,3 +297,230 @@ def extract_significant_words(
         dict[str, float] | None: Dictionary with significant tokens.
         In case of corrupt input arguments, None is returned.
     """
+
+
+def calculate_sources_digest(source_paths: list[str], block_size: int = 1 << 20) -> str | None:
+    """
+    Calculate a content hash of reference corpus source files without parsing them.
+
+    Raw bytes of every file are streamed into a single SHA-256 digest in blocks
+    of block_size bytes, each file prefixed with its length, so any change
+    of the content changes the digest regardless of file metadata.
+
+    Args:
+        source_paths (list[str]): Paths to files with corpus frequencies and IDF values
+        block_size (int): Number of bytes read at once
+
+    Returns:
+        str | None: Hexadecimal SHA-256 digest.
+        In case of corrupt input arguments or unreadable files, None is returned.
+    """
+
+
+class ReferenceStatistics:
+    """
+    Keep reference corpus statistics persisted between keyword extraction runs.
+
+    Statistics are stored in a JSON file together with the content digest and sizes
+    of the source files they were computed from. Source files are loaded and parsed
+    only when their digest differs from the cached one.
+
+    Attributes:
+        _cache_path (str): Path to the JSON file with cached statistics
+        _sources_digest (str): Content digest of the source files of the statistics
+        _sources_sizes (list[int]): Sizes of the source files of the statistics
+        _corpus_freqs (dict[str, int]): Token frequencies in corpus
+        _corpus_total (int): Total number of tokens in corpus
+        _idf (dict[str, float]): Inverse document frequency values
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        """
+        Initialize an instance of ReferenceStatistics.
+
+        Args:
+            cache_path (str): Path to the JSON file with cached statistics
+        """
+
+    def prepare(self, corpus_freqs_path: str, idf_path: str) -> bool | None:
+        """
+        Load statistics from the cache or recompute them from source files and save.
+
+        Sizes of the source files are compared with the cached ones first: if any differs,
+        the cache is stale and no digest is calculated. Otherwise the digest
+        is calculated by calculate_sources_digest and the cache is reused only if
+        it matches, so a cache hit reads raw bytes of the sources but never parses them.
+
+        Args:
+            corpus_freqs_path (str): Path to the JSON file with token frequencies in corpus
+            idf_path (str): Path to the JSON file with inverse document frequency values
+
+        Returns:
+            bool | None: True if cached statistics were reused, False if they were recomputed.
+            In case of corrupt input arguments or unreadable files, None is returned.
+        """
+
+    def calculate_tfidf(self, term_freq: dict[str, float]) -> dict[str, float] | None:
+        """
+        Calculate TF-IDF score for tokens with cached IDF values.
+
+        Args:
+            term_freq (dict[str, float]): Term frequency values
+
+        Returns:
+            dict[str, float] | None: Dictionary with tokens and TF-IDF values.
+            In case of corrupt input arguments or unprepared statistics, None is returned.
+        """
+
+    def calculate_expected_frequency(self, doc_freqs: dict[str, int]) -> dict[str, float] | None:
+        """
+        Calculate expected frequency for tokens with the cached corpus total.
+
+        Args:
+            doc_freqs (dict[str, int]): Token frequencies in document
+
+        Returns:
+            dict[str, float] | None: Dictionary with expected frequencies.
+            In case of corrupt input arguments or unprepared statistics, None is returned.
+        """
+
+    def calculate_chi_values(self, doc_freqs: dict[str, int]) -> dict[str, float] | None:
+        """
+        Calculate chi-squared values for tokens of a document.
+
+        Args:
+            doc_freqs (dict[str, int]): Token frequencies in document
+
+        Returns:
+            dict[str, float] | None: Dictionary with chi-squared values.
+            In case of corrupt input arguments or unprepared statistics, None is returned.
+        """
+
+
+class SparseCorpus:
+    """
+    Store token counts of a document collection in a compressed sparse row matrix.
+
+    Rows correspond to documents and columns correspond to interned term identifiers.
+
+    Attributes:
+        _term_ids (dict[str, int]): Mapping from a term to its identifier
+        _terms (list[str]): Terms ordered by their identifiers
+        _indptr (list[int]): Offsets of document rows in _indices and _counts
+        _indices (list[int]): Term identifiers of non-zero cells, row by row
+        _counts (list[int]): Occurrences of terms in non-zero cells, row by row
+        _document_frequencies (list[int]): Number of documents containing each term
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of SparseCorpus.
+        """
+
+    def add_document(self, tokens: list[str]) -> int | None:
+        """
+        Append a tokenized document as a new row of the matrix.
+
+        New terms are interned, counts are stored sorted by term identifier.
+
+        Args:
+            tokens (list[str]): Token sequence of the document
+
+        Returns:
+            int | None: Identifier of the added document.
+            In case of corrupt input arguments, None is returned.
+        """
+
+    def get_term_id(self, term: str) -> int | None:
+        """
+        Retrieve an identifier of an interned term.
+
+        Args:
+            term (str): Term to look up
+
+        Returns:
+            int | None: Identifier of the term.
+            In case of corrupt input arguments or unknown term, None is returned.
+        """
+
+    def get_term(self, term_id: int) -> str | None:
+        """
+        Retrieve a term by its identifier.
+
+        Args:
+            term_id (int): Identifier of the term
+
+        Returns:
+            str | None: The term.
+            In case of corrupt input arguments or unknown identifier, None is returned.
+        """
+
+    def calculate_idf(self) -> list[float] | None:
+        """
+        Calculate Inverse Document Frequency (IDF) for every term of the corpus.
+
+        IDF is computed as log(documents / (documents containing term + 1)).
+
+        Returns:
+            list[float] | None: IDF values indexed by term identifier.
+            In case of empty corpus, None is returned.
+        """
+
+    def calculate_tfidf(self, idf: dict[str, float]) -> list[float] | None:
+        """
+        Calculate TF-IDF scores for every non-zero cell in one pass.
+
+        Reference IDF values are mapped to term identifiers once per call, terms absent
+        from the reference get log 47 as in calculate_tfidf, so scores of a row are equal
+        to the ones of calculate_tfidf for the term frequencies of the document.
+
+        Args:
+            idf (dict[str, float]): Inverse document frequency values of the reference corpus
+
+        Returns:
+            list[float] | None: Scores aligned with the stored non-zero cells.
+            In case of corrupt input arguments or empty corpus, None is returned.
+        """
+
+    def calculate_chi_values(self, corpus_freqs: dict[str, int]) -> list[float] | None:
+        """
+        Calculate chi-squared values for every non-zero cell in one pass.
+
+        Expected frequencies are computed as in calculate_expected_frequency,
+        with document and reference corpus totals computed once per row and once per call.
+
+        Args:
+            corpus_freqs (dict[str, int]): Token frequencies in the reference corpus
+
+        Returns:
+            list[float] | None: Chi-squared values aligned with the stored non-zero cells.
+            In case of corrupt input arguments or empty corpus, None is returned.
+        """
+
+    def get_document_scores(self, document_id: int, scores: list[float]) -> dict[str, float] | None:
+        """
+        Convert scores of one matrix row into a dictionary.
+
+        Args:
+            document_id (int): Identifier of the document
+            scores (list[float]): Scores aligned with the stored non-zero cells
+
+        Returns:
+            dict[str, float] | None: Dictionary with tokens and their scores in the document.
+            In case of corrupt input arguments, None is returned.
+        """
+
+    def extract_significant_words(
+        self, chi_values: list[float], alpha: float
+    ) -> list[dict[str, float]] | None:
+        """
+        Select tokens with chi-squared values greater than the critical threshold in every document.
+
+        Args:
+            chi_values (list[float]): Chi-squared values aligned with the stored non-zero cells
+            alpha (float): Significance level controlling chi-squared threshold
+
+        Returns:
+            list[dict[str, float]] | None: Dictionaries with significant tokens per document.
+            In case of corrupt input arguments, None is returned.
+        """
@@ -4,6 +4,7 @@ Lab 2.
 Text retrieval with BM25
 """
 # pylint:disable=too-many-arguments, unused-argument
+import threading
 
 
 def tokenize(text: str) -> list[str] | None:
@@ -184,16 +185,71 @@ def load_index(file_path: str) -> list[dict[str, float]] | None:
     """
     Load the index from a file.
 
+    Only JSON indexes saved by save_index are loaded. Binary indexes saved by
+    save_index_binary are not decoded here: they are opened lazily with
+    open_binary_index and queried with BinaryIndexReader.rank
+    or BinaryIndexReader.retrieve_top_k.
+
     Args:
         file_path (str): The path to the file from which to load the index.
 
     Returns:
         list[dict[str, float]] | None: The loaded index.
 
+    In case of corrupt input arguments or a binary index file, None is returned.
+    """
+
+
+def encode_varint(value: int) -> bytes | None:
+    """
+    Encode a non-negative integer as a variable-length sequence of bytes.
+
+    Every byte stores 7 bits of the value, the highest bit marks that more bytes follow.
+
+    Args:
+        value (int): Non-negative integer to encode.
+
+    Returns:
+        bytes | None: Encoded value.
+
     In case of corrupt input arguments, None is returned.
     """
 
 
+def decode_varint(data: bytes | memoryview, offset: int) -> tuple[int, int] | None:
+    """
+    Decode a variable-length integer starting at the given offset.
+
+    Args:
+        data (bytes | memoryview): Encoded data.
+        offset (int): Position of the first byte of the value.
+
+    Returns:
+        tuple[int, int] | None: Decoded value and position of the next byte.
+
+    In case of corrupt input arguments or truncated data, None is returned.
+    """
+
+
+def save_index_binary(
+    index: list[dict[str, float]], file_path: str, first_document: int = 0
+) -> None:
+    """
+    Save the index to a file in a compact binary format.
+
+    The file consists of a header with numbers of documents and terms and the global
+    index of the first document, a sorted term dictionary with offsets of postings
+    and a block of postings. Each postings list stores gaps between document indices
+    as varints followed by weights as float16, zero weights are not stored.
+
+    Args:
+        index (list[dict[str, float]]): The index to save.
+        file_path (str): The path to the file where the index will be saved.
+        first_document (int): Global index of the first document of the index,
+            non-zero for shards built by build_sharded_index.
+    """
+
+
 def calculate_spearman(rank: list[int], golden_rank: list[int]) -> float | None:
     """
     Calculate Spearman's rank correlation coefficient between two rankings.
@@ -207,3 +263,755 @@ def calculate_spearman(rank: list[int], golden_rank: list[int]) -> float | None:
 
     In case of corrupt input arguments, None is returned.
     """
+
+
+def calculate_spearman_batch(
+    ranks: list[list[int]], golden_ranks: list[list[int]]
+) -> list[float] | None:
+    """
+    Calculate Spearman's rank correlation coefficients for many pairs of rankings.
+
+    Positions of golden documents are computed once per query and squared differences
+    are summed in a single pass, so each value is equal to the one of calculate_spearman.
+
+    Args:
+        ranks (list[list[int]]): Ranked lists of document indices, one per query.
+        golden_ranks (list[list[int]]): Golden ranked lists of document indices, one per query.
+
+    Returns:
+        list[float] | None: Spearman's rank correlation coefficient of every query.
+
+    In case of corrupt input arguments or different numbers of rankings, None is returned.
+    """
+
+
+def calculate_ndcg(rank: list[int], golden_rank: list[int], k: int | None = None) -> float | None:
+    """
+    Calculate Normalized Discounted Cumulative Gain of a ranking.
+
+    Relevance of a document is its distance from the end of the golden ranking,
+    so the first golden document has the highest relevance.
+
+    Args:
+        rank (list[int]): Ranked list of document indices.
+        golden_rank (list[int]): Golden ranked list of document indices.
+        k (int | None): Number of top positions to consider, the whole ranking if None.
+
+    Returns:
+        float | None: nDCG value in range [0, 1].
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+def calculate_average_precision(
+    rank: list[int], golden_rank: list[int], relevant_count: int
+) -> float | None:
+    """
+    Calculate Average Precision of a ranking.
+
+    The first relevant_count documents of the golden ranking are considered relevant.
+
+    Args:
+        rank (list[int]): Ranked list of document indices.
+        golden_rank (list[int]): Golden ranked list of document indices.
+        relevant_count (int): Number of relevant documents.
+
+    Returns:
+        float | None: Average Precision value in range [0, 1].
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+def calculate_percentiles(
+    values: list[float], percentiles: list[float]
+) -> dict[float, float] | None:
+    """
+    Calculate percentiles of values with linear interpolation.
+
+    Args:
+        values (list[float]): Values to describe.
+        percentiles (list[float]): Percentiles in range [0, 100].
+
+    Returns:
+        dict[float, float] | None: Mapping from a percentile to its value.
+
+    In case of corrupt input arguments or empty values, None is returned.
+    """
+
+
+def count_shard(
+    documents: list[str], stopwords: list[str]
+) -> tuple[list[dict[str, int]], dict[str, int]] | None:
+    """
+    Tokenize documents of a shard and count their terms.
+
+    The function is a unit of work sent to worker processes by build_sharded_index.
+
+    Args:
+        documents (list[str]): Raw documents of the shard.
+        stopwords (list[str]): List of stopwords.
+
+    Returns:
+        tuple[list[dict[str, int]], dict[str, int]] | None: Term counts of every document
+            and numbers of shard documents containing each term.
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+def merge_document_frequencies(shard_frequencies: list[dict[str, int]]) -> dict[str, int] | None:
+    """
+    Sum document frequencies of all shards.
+
+    Args:
+        shard_frequencies (list[dict[str, int]]): Numbers of documents containing each term
+            in every shard.
+
+    Returns:
+        dict[str, int] | None: Numbers of documents containing each term in the whole collection.
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+def build_sharded_index(
+    documents: list[str],
+    stopwords: list[str],
+    directory: str,
+    shards_count: int,
+    processes: int | None = None,
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> list[str] | None:
+    """
+    Build BM25 indexes of document shards in a pool of worker processes.
+
+    Shards are counted in parallel by count_shard. Document frequencies and lengths of
+    all shards are merged into global IDF and average document length, then
+    BM25 weights of each shard are calculated with these global statistics and
+    saved by save_index_binary together with the global index of the shard's
+    first document, so scores of different shards are comparable and
+    ShardedSearcher needs nothing but the returned paths.
+
+    Args:
+        documents (list[str]): Raw documents.
+        stopwords (list[str]): List of stopwords.
+        directory (str): Directory to save shard indexes to.
+        shards_count (int): Number of contiguous shards to split documents into.
+        processes (int | None): Number of worker processes, all available CPUs are used if None.
+        k1 (float): BM25 parameter.
+        b (float): BM25 parameter.
+
+    Returns:
+        list[str] | None: Paths to saved shard indexes in the order of shards.
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+class InvertedIndex:
+    """
+    Inverted index for BM25 retrieval.
+
+    Attributes:
+        _postings (dict[str, list[tuple[int, int]]]): Mapping from a term to postings
+            of document index and number of term occurrences, sorted by document index.
+        _doc_lengths (list[int]): Lengths of indexed documents.
+        _avg_doc_len (float): Average length of indexed documents.
+        _idf (dict[str, float]): Inverse document frequencies of terms.
+        _upper_bounds (dict[str, float]): Maximum BM25 score of every term over its postings,
+            clipped at zero.
+        _k1 (float): BM25 parameter.
+        _b (float): BM25 parameter.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """
+        Initialize an instance of the InvertedIndex class.
+
+        Args:
+            k1 (float): BM25 parameter.
+            b (float): BM25 parameter.
+        """
+
+    def build(self, documents: list[list[str]]) -> bool:
+        """
+        Build postings, document lengths, IDF and score upper bounds for tokenized documents.
+
+        IDF is calculated with the same formula as in calculate_idf,
+        using the length of a postings list as the number of documents with the term.
+        Upper bounds are calculated in the same pass over postings,
+        so queries never scan the whole index.
+
+        Args:
+            documents (list[list[str]]): List of tokenized documents.
+
+        Returns:
+            bool: True if documents are successfully indexed.
+
+        In case of corrupt input arguments, False is returned.
+        """
+
+    def get_postings(self, term: str) -> list[tuple[int, int]] | None:
+        """
+        Get postings of a term.
+
+        Args:
+            term (str): Term to look up.
+
+        Returns:
+            list[tuple[int, int]] | None: Tuples of document index and number of term occurrences.
+
+        In case of corrupt input arguments, None is returned.
+        In case of a term absent from the index, an empty list is returned.
+        """
+
+    def score_term(self, term: str, document_index: int, term_count: int) -> float | None:
+        """
+        Calculate BM25 score of a single term in a document.
+
+        Args:
+            term (str): Term to score.
+            document_index (int): Index of the document.
+            term_count (int): Number of term occurrences in the document.
+
+        Returns:
+            float | None: BM25 score equal to the one calculated by calculate_bm25.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def rank(
+        self, query: str, stopwords: list[str], alpha: float | None = None
+    ) -> list[tuple[int, float]] | None:
+        """
+        Rank documents for the given query using postings of query terms only.
+
+        Scores are accumulated per document while walking postings lists of query terms.
+        Documents without query terms get zero score, so the ranking is equal to
+        the output of rank_documents for indexes built by calculate_bm25 if alpha is None
+        or by calculate_bm25_with_cutoff with the same alpha otherwise.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            list[tuple[int, float]] | None: Tuples of document index and its score in the ranking.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def get_upper_bounds(
+        self, terms: list[str], alpha: float | None = None
+    ) -> dict[str, float] | None:
+        """
+        Get the maximum BM25 scores of the given terms over their postings.
+
+        Bounds are taken from _upper_bounds calculated by build, so the cost is proportional
+        to the number of terms. They are clipped at zero, because a document without a term
+        gets zero score for it. Terms with IDF below alpha get zero bound as in
+        calculate_bm25_with_cutoff, the cutoff does not depend on documents and is applied
+        on lookup, so one set of bounds serves every alpha.
+
+        Args:
+            terms (list[str]): Terms to get bounds of, usually the terms of a query.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            dict[str, float] | None: Mapping from terms to their score upper bounds.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def retrieve_top_k(
+        self, query: str, stopwords: list[str], k: int, alpha: float | None = None
+    ) -> list[tuple[int, float]] | None:
+        """
+        Retrieve k best documents with MaxScore dynamic pruning.
+
+        Query terms are sorted by their upper bounds returned by get_upper_bounds.
+        Terms whose summed bounds cannot lift
+        a document above the current k-th score are non-essential: their postings are only
+        probed for documents found in postings of essential terms. A document is dropped
+        as soon as its partial score plus remaining bounds is less than the k-th score,
+        documents with equal bound are kept to preserve ordering of ties.
+
+        Scores of matching documents can be negative, as IDF is negative for terms
+        occurring in more than half of the documents, and fewer than k documents
+        may match. In both cases documents without query terms outrank or complement
+        the matching ones: they are taken with 0.0 score in the order of their indices,
+        exactly as they are placed by rank.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            k (int): Number of documents to retrieve.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            list[tuple[int, float]] | None: The first k tuples of the ranking returned by rank
+                with the same alpha.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+
+class BinaryIndexReader:
+    """
+    Lazy reader of an index saved by save_index_binary.
+
+    Attributes:
+        _file_path (str): Path to the binary index.
+        _mapping (mmap.mmap | None): Read-only memory mapping of the file.
+        _terms (dict[str, tuple[int, int]]): Mapping from a term to offset and length
+            of its postings list.
+        _documents_count (int): Number of indexed documents.
+        _first_document (int): Global index of the first document stored in the header.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize an instance of the BinaryIndexReader class.
+
+        Args:
+            file_path (str): Path to the binary index.
+        """
+
+    def open(self) -> bool:
+        """
+        Map the file into memory and read the header and the term dictionary.
+
+        Postings are not decoded, so opening takes time proportional to the vocabulary only,
+        and processes opening the same file share its pages.
+
+        Returns:
+            bool: True if the index is successfully opened.
+
+        In case of a missing or malformed file, False is returned.
+        """
+
+    def get_postings(self, term: str) -> list[tuple[int, float]] | None:
+        """
+        Decode postings of a term.
+
+        Args:
+            term (str): Term to look up.
+
+        Returns:
+            list[tuple[int, float]] | None: Tuples of document index and weight of the term.
+
+        In case of corrupt input arguments or an unopened index, None is returned.
+        In case of a term absent from the index, an empty list is returned.
+        """
+
+    def get_documents_count(self) -> int | None:
+        """
+        Get the number of documents of the index.
+
+        Returns:
+            int | None: The number of documents stored in the header.
+
+        In case of an unopened index, None is returned.
+        """
+
+    def rank(self, query: str, stopwords: list[str]) -> list[tuple[int, float]] | None:
+        """
+        Rank documents of the index for the given query decoding postings of query terms only.
+
+        Weights of query terms are accumulated per document, documents without query terms
+        get zero score, so the ranking is equal to the output of rank_documents
+        for the index returned by to_index.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+
+        Returns:
+            list[tuple[int, float]] | None: Tuples of document index and its score in the ranking,
+                document indices are local to the index.
+
+        In case of corrupt input arguments or an unopened index, None is returned.
+        """
+
+    def retrieve_top_k(
+        self, query: str, stopwords: list[str], k: int
+    ) -> list[tuple[int, float]] | None:
+        """
+        Retrieve k best documents of the index without sorting the whole ranking.
+
+        Matching documents are selected with a heap of size k. Weights may be negative,
+        so if fewer than k documents have a positive score, documents without
+        query terms complement the result with 0.0 score in the order of their indices,
+        ahead of matching documents with negative scores, as they are placed by rank.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            k (int): Number of documents to retrieve.
+
+        Returns:
+            list[tuple[int, float]] | None: The first k tuples of the ranking returned by rank.
+
+        In case of corrupt input arguments or an unopened index, None is returned.
+        """
+
+    def get_first_document(self) -> int | None:
+        """
+        Get the global index of the first document of the index.
+
+        Returns:
+            int | None: The index stored in the header, zero for unsharded indexes.
+
+        In case of an unopened index, None is returned.
+        """
+
+    def to_index(self) -> list[dict[str, float]] | None:
+        """
+        Decode the whole index into the format returned by load_index.
+
+        This is an explicit opt-in for callers that need the dense format:
+        all postings are decoded eagerly and zero weights are filled for every term
+        of the dictionary. Weights are restored with float16 precision.
+
+        Returns:
+            list[dict[str, float]] | None: The loaded index.
+
+        In case of an unopened index, None is returned.
+        """
+
+    def close(self) -> None:
+        """
+        Release the memory mapping.
+        """
+
+
+def open_binary_index(file_path: str) -> BinaryIndexReader | None:
+    """
+    Open an index saved by save_index_binary without decoding its postings.
+
+    Args:
+        file_path (str): The path to the binary index.
+
+    Returns:
+        BinaryIndexReader | None: The opened lazy reader.
+
+    In case of corrupt input arguments or a malformed file, None is returned.
+    """
+
+
+class IncrementalInvertedIndex(InvertedIndex):
+    """
+    Inverted index that supports adding and deleting documents without rebuilding.
+
+    New documents are written to the newest segment. Deleted documents are tombstoned
+    and physically removed when segments are merged. Every addition or deletion changes
+    the number of live documents and therefore IDF of every term, so the inherited _idf
+    is not used: IDF and the average document length are calculated at query time
+    from document frequencies, the number of live documents and their total length.
+
+    Sealed segments are never changed in place, only replaced by merge_segments,
+    while the newest segment is changed by add_document. Queries therefore take
+    a snapshot under _lock: the list of segments, copies of postings lists of query terms
+    in the newest segment, the tombstones and the statistics. Scoring then runs
+    on the snapshot without the lock, so concurrent additions neither block queries
+    nor change dictionaries they iterate over.
+
+    Attributes:
+        _segments (list[dict[str, list[tuple[int, int]]]]): Postings of index segments,
+            the last one receives new documents.
+        _tombstones (set[int]): Indices of deleted documents.
+        _document_terms (dict[int, list[str]]): Distinct terms of every live document,
+            used to update document frequencies on deletion.
+        _document_segments (dict[int, int]): Position of the segment holding every document.
+        _document_frequencies (dict[str, int]): Number of live documents containing each term.
+        _live_documents_count (int): Number of live documents.
+        _total_length (int): Summed length of live documents.
+        _segment_size (int): Number of documents after which a new segment is started.
+        _lock (threading.Lock): Lock guarding segments, tombstones and statistics.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, segment_size: int = 1000) -> None:
+        """
+        Initialize an instance of the IncrementalInvertedIndex class.
+
+        Args:
+            k1 (float): BM25 parameter.
+            b (float): BM25 parameter.
+            segment_size (int): Number of documents after which a new segment is started.
+        """
+
+    def build(self, documents: list[list[str]]) -> bool:
+        """
+        Index tokenized documents as a single sealed segment.
+
+        Args:
+            documents (list[list[str]]): List of tokenized documents.
+
+        Returns:
+            bool: True if documents are successfully indexed.
+
+        In case of corrupt input arguments, False is returned.
+        """
+
+    def add_document(self, document: list[str]) -> int | None:
+        """
+        Append a tokenized document to the newest segment under the lock.
+
+        Document frequencies, the number of live documents and the total length
+        are updated in place, no IDF value is recalculated. Distinct terms
+        of the document are stored in _document_terms.
+
+        Args:
+            document (list[str]): Tokenized document.
+
+        Returns:
+            int | None: Index of the added document.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def delete_document(self, document_index: int) -> bool:
+        """
+        Tombstone a document under the lock.
+
+        Document frequencies of its terms taken from _document_terms, the number of live
+        documents and the total length are decreased without scanning segments.
+        Its entry in _document_terms is removed, its postings are skipped at query time
+        until the segment holding it is merged.
+
+        Args:
+            document_index (int): Index of the document to delete.
+
+        Returns:
+            bool: True if the document is successfully deleted.
+
+        In case of corrupt input arguments or an already deleted document, False is returned.
+        """
+
+    def get_idf(self, term: str) -> float | None:
+        """
+        Calculate IDF of a term from current document frequencies.
+
+        The formula is the same as in calculate_idf, with the number of live documents
+        as the size of the collection.
+
+        Args:
+            term (str): Term to calculate IDF for.
+
+        Returns:
+            float | None: IDF of the term.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def merge_segments(self) -> bool:
+        """
+        Merge all sealed segments into one and drop postings of tombstoned documents.
+
+        Tombstones are snapshotted under the lock before merging, and the merged segment
+        is built aside from the snapshot. When it is swapped in under the lock, only
+        the snapshotted tombstones of documents held by the merged segments are removed,
+        as their postings are gone. Tombstones of documents in the newest segment,
+        which is not merged, and of documents deleted while merging are kept,
+        so these documents stay deleted until a later merge drops their postings.
+        Queries keep using old segments while merging is in progress.
+
+        Returns:
+            bool: True if segments are successfully merged.
+
+        In case of nothing to merge, False is returned.
+        """
+
+    def merge_in_background(self) -> threading.Thread | None:
+        """
+        Start merge_segments in a daemon thread.
+
+        Returns:
+            threading.Thread | None: The started thread.
+
+        In case a merge is already running, None is returned.
+        """
+
+    def get_postings(self, term: str) -> list[tuple[int, int]] | None:
+        """
+        Get postings of a term from all segments, skipping tombstoned documents.
+
+        Postings and tombstones are read from a snapshot taken under the lock.
+
+        Args:
+            term (str): Term to look up.
+
+        Returns:
+            list[tuple[int, int]] | None: Tuples of document index and number of term occurrences,
+                sorted by document index.
+
+        In case of corrupt input arguments, None is returned.
+        In case of a term absent from the index, an empty list is returned.
+        """
+
+    def score_term(self, term: str, document_index: int, term_count: int) -> float | None:
+        """
+        Calculate BM25 score of a single term in a live document.
+
+        IDF is calculated by get_idf and the average document length is taken
+        over live documents at the moment of the call.
+
+        Args:
+            term (str): Term to score.
+            document_index (int): Index of the document.
+            term_count (int): Number of term occurrences in the document.
+
+        Returns:
+            float | None: BM25 score equal to the one calculated by calculate_bm25
+                over live documents.
+
+        In case of corrupt input arguments or a tombstoned document, None is returned.
+        """
+
+    def get_upper_bounds(
+        self, terms: list[str], alpha: float | None = None
+    ) -> dict[str, float] | None:
+        """
+        Calculate the maximum BM25 scores of the given terms over live postings of all segments.
+
+        IDF changes with every addition or deletion, so bounds are not cached:
+        only postings of the given terms are scanned, with current IDF values.
+
+        Args:
+            terms (list[str]): Terms to get bounds of, usually the terms of a query.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            dict[str, float] | None: Mapping from terms to their score upper bounds.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def rank(
+        self, query: str, stopwords: list[str], alpha: float | None = None
+    ) -> list[tuple[int, float]] | None:
+        """
+        Rank live documents for the given query across all segments.
+
+        Postings of query terms, tombstones and statistics are read from a snapshot
+        taken under the lock, the lock is released before scoring.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            list[tuple[int, float]] | None: Tuples of document index and its score in the ranking.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def retrieve_top_k(
+        self, query: str, stopwords: list[str], k: int, alpha: float | None = None
+    ) -> list[tuple[int, float]] | None:
+        """
+        Retrieve k best live documents with MaxScore dynamic pruning across all segments.
+
+        Upper bounds are calculated with current IDF values, tombstoned documents
+        are neither scored nor used to fill the result. As in rank, all reads
+        go to a snapshot taken under the lock, and pruning runs without the lock.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            k (int): Number of documents to retrieve.
+            alpha (float | None): IDF cutoff threshold, no cutoff is applied if None.
+
+        Returns:
+            list[tuple[int, float]] | None: The first k tuples of the ranking returned by rank
+                with the same alpha.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+
+class ShardedSearcher:
+    """
+    Search engine over indexes built by build_sharded_index.
+
+    Attributes:
+        _readers (list[BinaryIndexReader]): Readers of shard indexes.
+        _offsets (list[int]): Global index of the first document of every shard,
+            read from shard headers.
+        _documents_count (int): Number of documents in all shards, summed from shard headers.
+    """
+
+    def __init__(self, shard_paths: list[str]) -> None:
+        """
+        Initialize an instance of the ShardedSearcher class.
+
+        Args:
+            shard_paths (list[str]): Paths to shard indexes returned by build_sharded_index.
+        """
+
+    def retrieve_top_k(
+        self, query: str, stopwords: list[str], k: int
+    ) -> list[tuple[int, float]] | None:
+        """
+        Retrieve k best documents of the whole collection.
+
+        Each shard returns its own k best matching documents with global document indices.
+        As weights are calculated with global statistics, the global k best matching
+        documents are among them and are selected by merging shard results with a heap.
+
+        Documents without query terms get 0.0 score, as in InvertedIndex.rank. Weights
+        may be negative, so if fewer than k merged documents have a positive score,
+        the result is completed by documents scoring 0.0 in the order of global indices:
+        non-matching documents of all shards, enumerated from 0 to the total number
+        of documents summed from shard headers while skipping matching ones,
+        are merged with matching documents scoring exactly 0.0, ahead of
+        matching documents with negative scores.
+
+        Weights are stored as float16, so scores equal the ones of an unsharded
+        InvertedIndex only up to float16 rounding, and documents whose scores differ
+        by less than that precision may be ordered differently.
+
+        Args:
+            query (str): The query string.
+            stopwords (list[str]): List of stopwords.
+            k (int): Number of documents to retrieve.
+
+        Returns:
+            list[tuple[int, float]] | None: Tuples of document index and its score in the ranking.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+
+def evaluate_queries(
+    index: InvertedIndex,
+    queries: list[str],
+    golden_ranks: list[list[int]],
+    stopwords: list[str],
+    relevant_count: int = 3,
+) -> dict[str, float | dict[float, float]] | None:
+    """
+    Run queries through the index and evaluate ranking quality and latency.
+
+    Each query is ranked with index.rank and timed with time.perf_counter.
+    Quality metrics are calculated for all queries at once.
+
+    Args:
+        index (InvertedIndex): Built index to evaluate.
+        queries (list[str]): Query strings.
+        golden_ranks (list[list[int]]): Golden ranked lists of document indices, one per query.
+        stopwords (list[str]): List of stopwords.
+        relevant_count (int): Number of relevant documents for Average Precision.
+
+    Returns:
+        dict[str, float | dict[float, float]] | None: Mean Spearman coefficient, nDCG and MAP
+            under keys spearman, ndcg and map and 50th, 90th and 99th percentiles
+            of latency in seconds under key latency.
+
+    In case of corrupt input arguments or functions used return None, None is returned.
+    """
@@ -3,7 +3,7 @@ Lab 2.
 """
 
 # pylint:disable=unused-argument
-from typing import Literal
+from typing import Iterator, Literal
 
 
 def build_vocabulary(tokens: list[str]) -> dict[str, float] | None:
@@ -52,20 +52,107 @@ def calculate_jaccard_distance(token: str, candidate: str) -> float | None:
     """
 
 
+class BKTree:
+    """
+    Burkhard-Keller tree over vocabulary words with Levenshtein distance.
+
+    Children of a node are keyed by their distance to the node, so by the triangle
+    inequality a search within max_distance from a token only visits children
+    with keys in range [d - max_distance, d + max_distance], where d is the distance
+    between the token and the node. Jaro-Winkler distance does not satisfy
+    the triangle inequality and is not supported.
+
+    Attributes:
+        _root (str | None): Word stored in the root node.
+        _children (dict[str, dict[int, str]]): Mapping from a word to its children
+            keyed by distance.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of BKTree.
+        """
+
+    def build(self, vocabulary: dict[str, float]) -> bool:
+        """
+        Insert all vocabulary words into the tree.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+
+        Returns:
+            bool: True if the tree is successfully built.
+
+        In case of corrupt input arguments, False is returned.
+        """
+
+    def add(self, word: str) -> bool:
+        """
+        Insert a word into the tree.
+
+        Args:
+            word (str): Word to insert.
+
+        Returns:
+            bool: True if the word is inserted, False if it is already present.
+
+        In case of corrupt input arguments, False is returned.
+        """
+
+    def search(self, token: str, max_distance: int) -> dict[str, int] | None:
+        """
+        Find words within max_distance from the token.
+
+        Args:
+            token (str): Word to search for.
+            max_distance (int): Maximum Levenshtein distance of found words.
+
+        Returns:
+            dict[str, int] | None: Found words and their Levenshtein distances to the token.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def search_nearest(self, token: str) -> dict[str, int] | None:
+        """
+        Find all words at the minimum Levenshtein distance from the token in a single pass.
+
+        Nodes are visited best-first, in the order of their distance to the token.
+        The search radius starts unbounded and shrinks to the best distance found so far,
+        so subtrees that cannot contain a word at least as close are pruned,
+        and no node is visited twice.
+
+        Args:
+            token (str): Word to search for.
+
+        Returns:
+            dict[str, int] | None: Words at the minimum distance mapped to that distance.
+
+        In case of corrupt input arguments or an empty tree, None is returned.
+        """
+
+
 def calculate_distance(
     first_token: str,
     vocabulary: dict[str, float],
     method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
     alphabet: list[str] | None = None,
+    search_index: BKTree | None = None,
+    max_distance: int | None = None,
 ) -> dict[str, float] | None:
     """
     Calculate distance between two strings using the specified method.
 
+    If search_index and max_distance are given and the method is levenshtein,
+    only words within max_distance found by the tree are returned.
+
     Args:
         first_token (str): First string to compare.
         vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
         method (str): Method to use for comparison.
         alphabet (list[str]): The alphabet with letters.
+        search_index (BKTree | None): Tree built over the vocabulary.
+        max_distance (int | None): Maximum Levenshtein distance of returned words.
 
     Returns:
         dict[str, float] | None: Calculated distance score.
@@ -79,15 +166,20 @@ def find_correct_word(
     vocabulary: dict[str, float],
     method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
     alphabet: list[str] | None = None,
+    search_index: BKTree | None = None,
 ) -> str | None:
     """
     Find the most similar word from vocabulary using the specified method.
 
+    If search_index is given and the method is levenshtein, only the words returned
+    by BKTree.search_nearest are ranked.
+
     Args:
         wrong_word (str): Word that might be misspelled.
         vocabulary (dict[str, float]): Dict of candidate words.
         method (str): Method to use for comparison.
         alphabet (list[str]): The alphabet with letters.
+        search_index (BKTree | None): Tree built over the vocabulary.
 
     Returns:
         str | None: Word from vocabulary with the lowest distance score.
@@ -129,17 +221,47 @@ def fill_levenshtein_matrix(token: str, candidate: str) -> list[list[int]] | Non
     """
 
 
-def calculate_levenshtein_distance(token: str, candidate: str) -> int | None:
+def calculate_banded_levenshtein_distance(
+    token: str, candidate: str, max_distance: int | None = None
+) -> int | None:
+    """
+    Calculate the Levenshtein edit distance keeping only two rows of the matrix.
+
+    If max_distance is given, only cells within max_distance from the diagonal are filled,
+    and calculation stops as soon as every cell of a row exceeds max_distance.
+
+    Args:
+        token (str): First string.
+        candidate (str): Second string.
+        max_distance (int | None): Maximum distance of interest, no limit if None.
+
+    Returns:
+        int | None: Minimum number of single-character edits, equal to the last cell
+             of fill_levenshtein_matrix, or max_distance + 1 if the distance exceeds max_distance.
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+def calculate_levenshtein_distance(
+    token: str, candidate: str, max_distance: int | None = None
+) -> int | None:
     """
     Calculate the Levenshtein edit distance between two strings.
 
+    Without max_distance the distance is taken from the last cell of
+    fill_levenshtein_matrix. If max_distance is given, the distance is calculated
+    by calculate_banded_levenshtein_distance, so no matrix is allocated.
+
     Args:
         token (str): First string.
         candidate (str): Second string.
+        max_distance (int | None): Maximum distance of interest, no limit if None.
 
     Returns:
         int | None: Minimum number of single-character edits (insertions, deletions,
-             substitutions) required to transform token into candidate.
+             substitutions) required to transform token into candidate,
+             or max_distance + 1 if the distance exceeds max_distance.
 
     In case of corrupt input arguments, None is returned.
     """
@@ -238,6 +360,61 @@ def propose_candidates(word: str, alphabet: list[str]) -> tuple[str, ...] | None
     """
 
 
+def iterate_candidates(word: str, alphabet: list[str]) -> Iterator[str]:
+    """
+    Lazily generate candidate words using four basic operations.
+
+    Candidates are yielded in the same order as in generate_candidates,
+    but are never collected into a list.
+
+    Args:
+        word (str): The input word.
+        alphabet (list[str]): Alphabet for candidates creation.
+
+    Yields:
+        str: A candidate word, possibly repeated.
+
+    In case of corrupt input arguments, nothing is yielded.
+    """
+
+
+def propose_known_candidates(
+    word: str,
+    alphabet: list[str],
+    vocabulary: dict[str, float],
+    max_edits: int = 2,
+    exhaustive: bool = False,
+) -> tuple[str, ...] | None:
+    """
+    Find vocabulary words reachable from the word with the fewest edits.
+
+    Candidates of iterate_candidates are checked against the vocabulary as they are
+    generated, only found words are stored. Single-edit variants are deduplicated
+    before the next level of edits is generated from each of them.
+
+    Unless exhaustive is set, the next level is expanded only if no known words are
+    found at the current level. This differs from calculate_frequency_distance,
+    which scores candidates of both levels of propose_candidates: a more frequent word
+    two edits away is hidden by any known word one edit away. If exhaustive is set,
+    all levels are expanded and the result is equal to the vocabulary words
+    among propose_candidates for max_edits of 2.
+
+    Args:
+        word (str): The input incorrect word.
+        alphabet (list[str]): Alphabet for candidates creation.
+        vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+        max_edits (int): Maximum number of edit levels to expand.
+        exhaustive (bool): Whether to expand all levels regardless of found words.
+
+    Returns:
+        tuple[str, ...] | None: A sorted tuple of unique vocabulary words found
+            at the first level with any matches, or at all levels if exhaustive is set.
+
+    In case of corrupt input arguments, None is returned.
+    In case no known words are found within max_edits, an empty tuple is returned.
+    """
+
+
 def calculate_frequency_distance(
     word: str, frequencies: dict, alphabet: list[str]
 ) -> dict[str, float] | None:
@@ -350,3 +527,231 @@ def calculate_jaro_winkler_distance(
 
     In case of corrupt input arguments or corrupt outputs of used functions, None is returned.
     """
+
+
+def generate_deletes(word: str, max_distance: int) -> set[str] | None:
+    """
+    Generate all strings obtained by deleting up to max_distance letters from the word.
+
+    Args:
+        word (str): The input word.
+        max_distance (int): Maximum number of deleted letters.
+
+    Returns:
+        set[str] | None: Unique strings including the word itself.
+
+    In case of corrupt input arguments, None is returned.
+    """
+
+
+class DeletionIndex:
+    """
+    Index of vocabulary words by their deletion neighbourhood.
+
+    Two words are within edit distance max_distance only if their deletion
+    neighbourhoods of size max_distance intersect, so candidates are found
+    with dictionary lookups instead of comparisons with every vocabulary word.
+
+    Attributes:
+        _vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+        _max_distance (int): Maximum edit distance of candidates.
+        _deletes (dict[str, list[str]]): Mapping from a deletion variant to vocabulary words
+            producing it.
+    """
+
+    def __init__(self, vocabulary: dict[str, float], max_distance: int = 2) -> None:
+        """
+        Initialize an instance of DeletionIndex.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies,
+                as returned by build_vocabulary.
+            max_distance (int): Maximum edit distance of candidates.
+        """
+
+    def build(self) -> bool:
+        """
+        Fill the index with deletion variants of every vocabulary word.
+
+        Returns:
+            bool: True if the index is successfully built.
+
+        In case of corrupt vocabulary or max_distance, False is returned.
+        """
+
+    def lookup(self, wrong_word: str) -> list[str] | None:
+        """
+        Find vocabulary words within max_distance edits from the word.
+
+        Deletion variants of the word are looked up in the index,
+        found words are verified with calculate_levenshtein_distance bounded
+        by max_distance, as intersecting neighbourhoods do not guarantee the distance.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+
+        Returns:
+            list[str] | None: Sorted list of candidate words.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def find_correct_word(
+        self,
+        wrong_word: str,
+        method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
+        alphabet: list[str] | None = None,
+    ) -> str | None:
+        """
+        Find the most similar word, searching only candidates returned by lookup if possible.
+
+        The deletion neighbourhood bounds the Levenshtein distance only, so candidates
+        are used for the levenshtein method alone: they are ranked by calculate_distance
+        with the same tie-breaking rules as in find_correct_word, and the result is equal
+        to the one of find_correct_word over the whole vocabulary. If no candidates
+        are found, or for any other method, whose best word may lie outside
+        the neighbourhood, find_correct_word is called over the whole vocabulary.
+
+        Args:
+            wrong_word (str): Word that might be misspelled.
+            method (str): Method to use for comparison.
+            alphabet (list[str]): The alphabet with letters.
+
+        Returns:
+            str | None: Word from vocabulary with the lowest distance score.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+
+def init_correction_worker(
+    vocabulary: dict[str, float],
+    method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
+    alphabet: list[str] | None = None,
+) -> None:
+    """
+    Store the vocabulary, method and alphabet used by correct_words_chunk in the worker.
+
+    The settings are kept in a module-level variable of the worker process for as long
+    as the pool of the DocumentCorrector that started it lives, calling the function
+    again replaces them.
+
+    Args:
+        vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+        method (str): Method to use for comparison.
+        alphabet (list[str]): The alphabet with letters.
+
+    In case of corrupt input arguments, nothing is stored and
+    previously stored settings, if any, are kept.
+    """
+
+
+def correct_words_chunk(words: list[str]) -> dict[str, str | None] | None:
+    """
+    Correct unique words with find_correct_word using settings stored by init_correction_worker.
+
+    Words are corrected independently, so the mapping is equal to calling
+    find_correct_word for each word with the stored vocabulary, method and alphabet.
+
+    Args:
+        words (list[str]): Unique words to correct.
+
+    Returns:
+        dict[str, str | None] | None: Mapping from a word to the output of find_correct_word.
+
+    In case of corrupt input arguments or a process where init_correction_worker
+    has not been called, None is returned.
+    """
+
+
+class DocumentCorrector:
+    """
+    Correct whole documents reusing corrections of recurring misspellings.
+
+    Attributes:
+        _vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+        _method (str): Method to use for comparison.
+        _alphabet (list[str] | None): The alphabet with letters.
+        _cache (dict[str, str | None]): Corrections in the order of their last use.
+        _cache_size (int): Maximum number of corrections kept in the cache.
+        _processes (int | None): Number of worker processes.
+        _min_parallel_words (int): Minimum number of cache misses corrected in worker processes.
+        _pool (multiprocessing.pool.Pool | None): Pool of worker processes,
+            started on first use and kept until close is called.
+        _hits (int): Number of out-of-vocabulary words found in the cache.
+        _lookups (int): Number of out-of-vocabulary words looked up in the cache.
+    """
+
+    def __init__(
+        self,
+        vocabulary: dict[str, float],
+        method: Literal["jaccard", "frequency-based", "levenshtein", "jaro-winkler"],
+        alphabet: list[str] | None = None,
+        cache_size: int = 10000,
+        processes: int | None = None,
+        min_parallel_words: int = 32,
+    ) -> None:
+        """
+        Initialize an instance of DocumentCorrector.
+
+        Args:
+            vocabulary (dict[str, float]): Dictionary mapping words to their relative frequencies.
+            method (str): Method to use for comparison.
+            alphabet (list[str]): The alphabet with letters.
+            cache_size (int): Maximum number of corrections kept in the cache.
+            processes (int | None): Number of worker processes,
+                all available CPUs are used if None.
+            min_parallel_words (int): Minimum number of cache misses in a document
+                to correct them in worker processes.
+        """
+
+    def correct_document(self, tokens: list[str]) -> list[str] | None:
+        """
+        Replace out-of-vocabulary tokens of a document with their corrections.
+
+        Out-of-vocabulary tokens are found by find_out_of_vocab_words and deduplicated.
+        Tokens present in the cache are moved to its end. If fewer than min_parallel_words
+        tokens remain, they are corrected by find_correct_word in the current process,
+        otherwise they are split into chunks corrected by correct_words_chunk
+        in the pool, which is started with init_correction_worker on first use
+        and reused by later documents.
+        New corrections are added to the cache, evicting the least recently used ones.
+        Tokens without a correction are left unchanged.
+
+        Args:
+            tokens (list[str]): List of tokens.
+
+        Returns:
+            list[str] | None: List of tokens with corrected words.
+
+        In case of corrupt input arguments, None is returned.
+        """
+
+    def close(self) -> None:
+        """
+        Terminate the pool of worker processes if it was started.
+        """
+
+    def __enter__(self) -> "DocumentCorrector":
+        """
+        Enter a context that closes the corrector on exit.
+
+        Returns:
+            DocumentCorrector: The corrector itself.
+        """
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Close the corrector when leaving the context, even if an exception was raised.
+
+        Args:
+            *exc_info (object): Type, value and traceback of a raised exception, if any.
+        """
+
+    def get_hit_rate(self) -> float:
+        """
+        Get the share of out-of-vocabulary words found in the cache since creation.
+
+        Returns:
+            float: Cache hit rate in range [0, 1], 0.0 if nothing was looked up.
+        """
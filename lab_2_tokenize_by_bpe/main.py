@@ -3,6 +3,7 @@ Lab 2.
 
 BPE and machine translation evaluation
 """
+from typing import Iterable
 
 def prepare_word(raw_word: str, start_of_word: str | None, end_of_word: str | None) -> tuple[str, ...] | None:
     """
@@ -36,6 +37,68 @@ def collect_frequencies(text: str, start_of_word: str | None, end_of_word: str)
     None is returned
     """
 
+def collect_frequencies_from_lines(lines: Iterable[str], start_of_word: str | None, end_of_word: str) -> dict[tuple[str, ...], int] | None:
+    """
+    Count number of occurrences of each word in a stream of lines.
+
+    Lines are consumed one by one, so the text is never joined into a single string.
+    As words never span line breaks, the result is equal to collect_frequencies
+    for the concatenated text.
+
+    Args:
+        lines (Iterable[str]): Lines of original text with no preprocessing
+        start_of_word (str): A token that signifies the start of word
+        end_of_word (str): A token that signifies the end of word
+
+    Returns:
+        dict[tuple[str, ...], int]: Dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
+def merge_frequencies(first_frequencies: dict[tuple[str, ...], int], second_frequencies: dict[tuple[str, ...], int]) -> dict[tuple[str, ...], int] | None:
+    """
+    Sum two dictionaries of word occurrences.
+
+    Args:
+        first_frequencies (dict[tuple[str, ...], int]): A dictionary in the form of
+            <preprocessed word: number of occurrences>
+        second_frequencies (dict[tuple[str, ...], int]): A dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    Returns:
+        dict[tuple[str, ...], int]: A dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    In case of corrupt input arguments, None is returned
+    """
+
+def collect_frequencies_from_files(paths: list[str], start_of_word: str | None, end_of_word: str, processes: int | None = None, chunk_lines: int = 10000) -> dict[tuple[str, ...], int] | None:
+    """
+    Count number of occurrences of each word in text files using a pool of worker processes.
+
+    Files are read line by line, chunks of chunk_lines lines are counted by
+    collect_frequencies_from_lines in worker processes and partial dictionaries
+    are combined with merge_frequencies as soon as they are ready.
+
+    Args:
+        paths (list[str]): Paths to files with original text
+        start_of_word (str): A token that signifies the start of word
+        end_of_word (str): A token that signifies the end of word
+        processes (int | None): A number of worker processes,
+            all available CPUs are used if None
+        chunk_lines (int): A number of lines sent to a worker at once
+
+    Returns:
+        dict[tuple[str, ...], int]: Dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
 def count_tokens_pairs(word_frequencies: dict[tuple[str, ...], int]) -> dict[tuple[str, str], int] | None:
     """
     Count number of occurrences of each pair of subsequent tokens.
@@ -84,6 +147,65 @@ def train(word_frequencies: dict[tuple[str, ...], int] | None, num_merges: int)
     None is returned
     """
 
+def build_pair_index(word_frequencies: dict[tuple[str, ...], int]) -> tuple[dict[tuple[str, str], int], dict[tuple[str, str], set[tuple[str, ...]]]] | None:
+    """
+    Count pairs of subsequent tokens and remember words containing each pair.
+
+    Args:
+        word_frequencies (dict[tuple[str, ...], int]): A dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    Returns:
+        tuple[dict[tuple[str, str], int], dict[tuple[str, str], set[tuple[str, ...]]]]:
+            A dictionary in the form of <token pair: number of occurrences> and
+            a dictionary in the form of <token pair: words containing the pair>
+
+    In case of corrupt input arguments, None is returned
+    """
+
+def get_merge_priority(pair: tuple[str, str], count: int) -> tuple[int, int, str, tuple[str, str]] | None:
+    """
+    Build a heap key that orders pairs the same way as train chooses them.
+
+    A more frequent pair goes first, among equally frequent pairs the one producing
+    a longer token goes first, then the one producing a lexicographically smaller token.
+    Different pairs may produce the same token, e.g. ('a', 'bc') and ('ab', 'c'),
+    so the pair itself is the last key and the lexicographically smaller pair goes first,
+    as train takes the first of the sorted candidate pairs.
+
+    Args:
+        pair (tuple[str, str]): A pair of tokens
+        count (int): Number of occurrences of the pair
+
+    Returns:
+        tuple[int, int, str, tuple[str, str]]: A key in the form of
+            <negated count, negated merged token length, merged token, pair>
+
+    In case of corrupt input arguments, None is returned
+    """
+
+def train_incremental(word_frequencies: dict[tuple[str, ...], int] | None, num_merges: int) -> dict[tuple[str, ...], int] | None:
+    """
+    Create required number of new tokens keeping pair counts in a heap.
+
+    Pair counts and words containing each pair are built once by build_pair_index.
+    After a merge only words containing the merged pair are rewritten, counts of
+    their neighbouring pairs are updated and pushed to the heap with new keys.
+    Outdated heap entries are skipped when popped, so the result is identical to train.
+
+    Args:
+        word_frequencies (dict[tuple[str, ...], int]): A dictionary in the form of
+            <preprocessed word: number of occurrences>
+        num_merges (int): Required number of new tokens
+
+    Returns:
+        dict[tuple[str, ...], int]: A dictionary in the form of
+            <preprocessed word: number of occurrences>
+
+    In case of corrupt input arguments or functions used return None,
+    None is returned
+    """
+
 def get_vocabulary(word_frequencies: dict[tuple[str, ...], int], unknown_token: str) -> dict[str, int] | None:
     """
     Establish correspondence between tokens and its integer identifier.
@@ -161,6 +283,145 @@ def encode(original_text: str, vocabulary: dict[str, int] | None, start_of_word_
     None is returned
     """
 
+def init_encoding_worker(vocabulary: dict[str, int], start_of_word_token: str | None, end_of_word_token: str | None, unknown_token: str, cache_size: int = 100000) -> None:
+    """
+    Build the BPEEncoder of the current worker process.
+
+    The encoder is stored in a module-level variable of the worker and replaces
+    the one built before, if any. Its word cache is kept between chunks, so words
+    repeated across texts and batches are tokenized once per worker
+
+    Args:
+        vocabulary (dict[str, int]): A dictionary in the form of <token: identifier>
+        start_of_word_token (str): A start-of-word token
+        end_of_word_token (str): An end-of-word token
+        unknown_token (str): A token that signifies unknown sequence
+        cache_size (int): Maximum number of words kept in the cache of the worker encoder
+
+    In case of corrupt input arguments, no encoder is built and
+    the previous encoder of the worker, if any, is kept
+    """
+
+def encode_chunk(texts: list[str]) -> list[list[int]] | None:
+    """
+    Encode a chunk of texts with the encoder stored by init_encoding_worker.
+
+    Texts are encoded one by one with BPEEncoder.encode, so the result for every text
+    is equal to the one of encode with the same vocabulary and tokens
+
+    Args:
+        texts (list[str]): A chunk of original texts
+
+    Returns:
+        list[list[int]]: A list of token identifiers for each text
+
+    In case of corrupt input arguments, a process where init_encoding_worker
+    has not been called or methods used return None, None is returned
+    """
+
+class BPEEncoder:
+    """
+    Encode texts with a fixed vocabulary reusing results for repeated words.
+
+    Attributes:
+        _vocabulary (dict[str, int]): A dictionary in the form of <token: identifier>
+        _token_lengths (list[int]): Distinct lengths of vocabulary tokens in descending order
+        _start_of_word_token (str | None): A start-of-word token
+        _end_of_word_token (str | None): An end-of-word token
+        _unknown_token (str): A token that signifies unknown sequence
+        _cache (dict[tuple[str, ...], list[int]]): Encoded words in the order of their last use
+        _cache_size (int): Maximum number of words kept in the cache
+        _pool (multiprocessing.pool.Pool | None): Pool of worker processes,
+            started by the first call of encode_batch and kept until close is called
+    """
+
+    def __init__(self, vocabulary: dict[str, int], start_of_word_token: str | None, end_of_word_token: str | None, unknown_token: str, cache_size: int = 100000) -> None:
+        """
+        Initialize an instance of BPEEncoder.
+
+        Args:
+            vocabulary (dict[str, int]): A dictionary in the form of <token: identifier>
+            start_of_word_token (str): A start-of-word token
+            end_of_word_token (str): An end-of-word token
+            unknown_token (str): A token that signifies unknown sequence
+            cache_size (int): Maximum number of words kept in the cache
+        """
+
+    def tokenize_word(self, word: tuple[str, ...]) -> list[int] | None:
+        """
+        Split word into tokens the same way as tokenize_word.
+
+        Only substrings of lengths present in the vocabulary are looked up,
+        each lookup is a single dictionary access instead of a scan of the vocabulary.
+        Results are kept in a bounded cache: a hit moves the word to the end of the cache,
+        the least recently used word is evicted when the cache is full.
+
+        Args:
+            word (tuple[str, ...]): Preprocessed word
+
+        Returns:
+            list[int]: A list of token identifiers
+
+        In case of corrupt input arguments, None is returned
+        """
+
+    def encode(self, original_text: str) -> list[int] | None:
+        """
+        Translate decoded sequence into encoded one.
+
+        Args:
+            original_text (str): Original text
+
+        Returns:
+            list[int]: A list of token identifiers equal to the output of encode
+
+        In case of corrupt input arguments or methods used return None,
+        None is returned
+        """
+
+    def encode_batch(self, texts: list[str], processes: int | None = None, chunk_size: int = 64) -> list[list[int]] | None:
+        """
+        Encode many texts using a pool of worker processes.
+
+        The pool is started on the first call with init_encoding_worker as the initializer
+        and reused by later calls, so worker caches persist between batches.
+        Texts are split into chunks of chunk_size texts and only the texts
+        are sent to encode_chunk, results are returned in the order of texts.
+
+        Args:
+            texts (list[str]): Original texts
+            processes (int | None): A number of worker processes used to start the pool,
+                all available CPUs are used if None, ignored once the pool is started
+            chunk_size (int): A number of texts sent to a worker at once
+
+        Returns:
+            list[list[int]]: A list of token identifiers for each text
+
+        In case of corrupt input arguments or functions used return None,
+        None is returned
+        """
+
+    def close(self) -> None:
+        """
+        Terminate the pool of worker processes if it was started.
+        """
+
+    def __enter__(self) -> 'BPEEncoder':
+        """
+        Enter a context that closes the encoder on exit.
+
+        Returns:
+            BPEEncoder: The encoder itself
+        """
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Close the encoder when leaving the context.
+
+        Args:
+            *exc_info (object): Type, value and traceback of a raised exception, if any
+        """
+
 def collect_ngrams(text: str, order: int) -> list[tuple[str, ...]] | None:
     """
     Extract n-grams from the given sequence.
@@ -217,4 +478,79 @@ def calculate_bleu(actual: str | None, reference: str, max_order: int=3) -> floa
 
     In case of corrupt input arguments or functions used return None,
     None is returned
-    """
\ No newline at end of file
+    """
+
+def count_ngrams(text: str, max_order: int) -> list[dict[tuple[str, ...], int]] | None:
+    """
+    Count n-grams of all orders from 1 to max_order in one pass per order.
+
+    Args:
+        text (str): Original text
+        max_order (int): Max length of n-gram to count
+
+    Returns:
+        list[dict[tuple[str, ...], int]]: A list with a dictionary in the form of
+            <n-gram: number of occurrences> for each order
+
+    In case of corrupt input arguments, None is returned
+    """
+
+def count_matches(actual_counts: dict[tuple[str, ...], int], reference_counts: dict[tuple[str, ...], int]) -> tuple[int, int] | None:
+    """
+    Count predicted n-grams found in the reference and all predicted n-grams.
+
+    The ratio of the two values is equal to calculate_precision for the same sequences.
+
+    Args:
+        actual_counts (dict[tuple[str, ...], int]): Predicted n-grams in the form of
+            <n-gram: number of occurrences>
+        reference_counts (dict[tuple[str, ...], int]): Expected n-grams in the form of
+            <n-gram: number of occurrences>
+
+    Returns:
+        tuple[int, int]: Number of matching predicted n-grams and number of predicted n-grams
+
+    In case of corrupt input arguments, None is returned
+    """
+
+def calculate_bleu_batch(actual: list[str], reference: list[str], max_order: int = 3) -> list[float] | None:
+    """
+    Compare many pairs of sequences by virtue of BLEU metric.
+
+    N-grams of each sequence are counted once by count_ngrams,
+    each value is equal to calculate_bleu for the same pair.
+
+    Args:
+        actual (list[str]): Predicted sequences
+        reference (list[str]): Expected sequences
+        max_order (int): Max length of n-gram to consider for comparison
+
+    Returns:
+        list[float]: A value of BLEU metric for each pair
+
+    In case of corrupt input arguments, different numbers of sequences
+    or functions used return None, None is returned
+    """
+
+def calculate_corpus_bleu(actual: list[str], reference: list[str], max_order: int = 3, processes: int | None = None) -> float | None:
+    """
+    Compare a corpus of predicted sequences with expected ones by virtue of BLEU metric.
+
+    Numbers of matching and predicted n-grams returned by count_matches are summed
+    over all pairs for each order, Precision of an order is the ratio of the sums.
+    For a single pair the value is equal to calculate_bleu.
+    Pairs are counted in a pool of worker processes if processes is given.
+
+    Args:
+        actual (list[str]): Predicted sequences
+        reference (list[str]): Expected sequences
+        max_order (int): Max length of n-gram to consider for comparison
+        processes (int | None): A number of worker processes,
+            pairs are counted in the current process if None
+
+    Returns:
+        float: A value of BLEU metric for the corpus
+
+    In case of corrupt input arguments, different numbers of sequences
+    or functions used return None, None is returned
+    """
@@ -0,0 +1,14 @@
+import argparse
+from pathlib import Path
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--sizes',
+                    nargs='+',
+                    default=['1KB', '10KB', '100KB', '1MB', '10MB'])
+parser.add_argument('--repeats', type=int, default=7)
+parser.add_argument('--seed', type=int, default=42)
+parser.add_argument('--output', type=Path)
+parser.add_argument('--baseline', type=Path)
+parser.add_argument('--tolerance', type=float, default=0.2)
+parser.add_argument('--min-seconds', type=float, default=0.005)
+parser.add_argument('--min-memory-bytes', type=int, default=64 * 1024)
@@ -0,0 +1,284 @@
+"""
+Benchmark text statistics functions of the first laboratory works
+
+Synthetic corpora of the requested sizes are generated from a fixed seed,
+every function is timed on them and its peak memory is traced.
+Results are saved as JSON and compared against a stored baseline.
+"""
+import json
+import random
+import statistics
+import string
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import lab_1_classify_by_unigrams.main as classify_by_unigrams
+import lab_1_keywords_tfidf.main as keywords_tfidf
+from config.constants import PROJECT_ROOT
+from tools.benchmarks.argument_parser import parser
+
+SIZE_UNITS = {'KB': 1024, 'MB': 1024 ** 2}
+BLOCK_SIZE = SIZE_UNITS['MB']
+MAX_SIZE = 100 * SIZE_UNITS['MB']
+
+
+def parse_size(size: str) -> int:
+    """Convert a human-readable size into a number of bytes
+
+    Sizes are bounded by MAX_SIZE: inputs are materialized in memory
+    as lists of Python objects taking several times the corpus size.
+
+    Args:
+        size: a number followed by KB or MB, e.g. 10MB
+
+    Returns:
+        the number of bytes
+    """
+    unit = size[-2:].upper()
+    if unit not in SIZE_UNITS:
+        raise ValueError(f'Unknown size unit in {size}, expected one of {list(SIZE_UNITS)}')
+    number_of_bytes = int(float(size[:-2]) * SIZE_UNITS[unit])
+    if number_of_bytes > MAX_SIZE:
+        raise ValueError(f'Size {size} exceeds the maximum of {MAX_SIZE // SIZE_UNITS["MB"]}MB')
+    return number_of_bytes
+
+
+def generate_words(number_of_words: int, rng: random.Random) -> list[str]:
+    """Generate unique lowercase pseudo-words
+
+    Args:
+        number_of_words: the number of words to generate
+        rng: a seeded random generator
+
+    Returns:
+        a list of unique words
+    """
+    words: set[str] = set()
+    while len(words) < number_of_words:
+        words.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 12))))
+    return sorted(words)
+
+
+def generate_text(size: int, rng: random.Random) -> str:
+    """Generate a synthetic ASCII text of the given size
+
+    A block of at most 1MB is generated and repeated,
+    so that large texts are produced in reasonable time.
+
+    Args:
+        size: the number of characters in the text
+        rng: a seeded random generator
+
+    Returns:
+        the text
+    """
+    vocabulary = generate_words(2000, rng)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    punctuation = ['', '', '', '', ',', '.', '!', '?', ' 1984']
+
+    block_parts = []
+    block_length = 0
+    while block_length < min(size, BLOCK_SIZE):
+        word = rng.choices(vocabulary, weights=weights)[0]
+        part = f'{word.capitalize() if rng.random() < 0.1 else word}{rng.choice(punctuation)} '
+        block_parts.append(part)
+        block_length += len(part)
+    block = ''.join(block_parts)
+
+    repeats = size // len(block) + 1
+    return (block * repeats)[:size]
+
+
+def generate_frequencies(number_of_terms: int, rng: random.Random) -> dict[str, int]:
+    """Generate a synthetic frequency dictionary
+
+    Args:
+        number_of_terms: the number of terms in the dictionary
+        rng: a seeded random generator
+
+    Returns:
+        a dictionary of the form {term: occurrences}
+    """
+    return {word: rng.randint(1, 1000) for word in generate_words(number_of_terms, rng)}
+
+
+def prepare_inputs(size: int, seed: int) -> dict[str, tuple]:
+    """Prepare arguments of every benchmarked function for a corpus size
+
+    The number of distinct terms grows with the corpus size according to Heaps' law.
+
+    Args:
+        size: the corpus size in bytes
+        seed: a seed for synthetic data generation
+
+    Returns:
+        a dictionary of the form {function name: positional arguments}
+    """
+    rng = random.Random(seed)
+    text = generate_text(size, rng)
+    letters = [letter for letter in text.lower() if letter.isalpha()]
+
+    number_of_terms = max(10, int(10 * (size / 6) ** 0.5))
+    doc_freqs = generate_frequencies(number_of_terms, rng)
+    corpus_freqs = {term: count * rng.randint(1, 50) for term, count in doc_freqs.items()}
+    total = sum(doc_freqs.values())
+    term_freq = {term: count / total for term, count in doc_freqs.items()}
+    idf = {term: rng.uniform(0.0, 4.0) for term in doc_freqs}
+    expected = {term: count * rng.uniform(0.5, 1.5) for term, count in doc_freqs.items()}
+
+    number_of_values = max(1, size // 8)
+    predicted = [rng.random() for _ in range(number_of_values)]
+    actual = [rng.random() for _ in range(number_of_values)]
+
+    return {
+        'tokenize': (text,),
+        'calculate_frequencies': (letters,),
+        'calculate_mse': (predicted, actual),
+        'calculate_tfidf': (term_freq, idf),
+        'calculate_chi_values': (expected, doc_freqs),
+    }
+
+
+BENCHMARKED_FUNCTIONS: dict[str, Callable] = {
+    'tokenize': classify_by_unigrams.tokenize,
+    'calculate_frequencies': classify_by_unigrams.calculate_frequencies,
+    'calculate_mse': classify_by_unigrams.calculate_mse,
+    'calculate_tfidf': keywords_tfidf.calculate_tfidf,
+    'calculate_chi_values': keywords_tfidf.calculate_chi_values,
+}
+
+
+def measure(function: Callable, arguments: tuple, repeats: int) -> tuple[float, int]:
+    """Measure execution time and peak memory of a function
+
+    The function is called once before measuring: a function returning None
+    is a stub of a laboratory work that is not implemented yet, and timing it
+    would produce meaningless results.
+
+    Time is measured without tracing, the median of the repeats is taken
+    as it is less sensitive to outliers than the best or the mean run.
+    Peak memory is traced in a separate run.
+
+    Args:
+        function: the function to benchmark
+        arguments: positional arguments of the function
+        repeats: the number of timed runs
+
+    Returns:
+        the median time in seconds and the peak allocated memory in bytes
+
+    Raises:
+        NotImplementedError: if the function returns None
+    """
+    if function(*arguments) is None:
+        raise NotImplementedError(f'Lab function not implemented: {function.__module__}.'
+                                  f'{function.__name__} returned None')
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*arguments)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(*arguments)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak_memory
+
+
+def run_benchmarks(sizes: list[str], repeats: int, seed: int) -> list[dict[str, Any]]:
+    """Benchmark all functions on corpora of the given sizes
+
+    Args:
+        sizes: human-readable corpus sizes
+        repeats: the number of timed runs per function
+        seed: a seed for synthetic data generation
+
+    Returns:
+        a list of results with function name, size, time and peak memory
+    """
+    results = []
+    for size in sizes:
+        inputs = prepare_inputs(parse_size(size), seed)
+        for name, function in BENCHMARKED_FUNCTIONS.items():
+            seconds, peak_memory = measure(function, inputs[name], repeats)
+            print(f'{name:<25} {size:>6}: {seconds:.6f} s, {peak_memory} B')
+            results.append({
+                'function': name,
+                'size': size,
+                'seconds': seconds,
+                'peak_memory_bytes': peak_memory
+            })
+    return results
+
+
+def find_regressions(results: list[dict[str, Any]],
+                     baseline: list[dict[str, Any]],
+                     tolerance: float,
+                     floors: dict[str, float]) -> list[str]:
+    """Compare results against a baseline
+
+    A metric regresses only if it exceeds the baseline both relatively,
+    by more than the tolerance, and absolutely, by more than its floor,
+    so that timer noise on small inputs does not fail the check.
+
+    Args:
+        results: current benchmark results
+        baseline: stored benchmark results
+        tolerance: allowed relative slowdown or memory growth, e.g. 0.2 for 20%
+        floors: allowed absolute growth per metric, e.g. {'seconds': 0.005}
+
+    Returns:
+        a list of regression descriptions
+    """
+    baseline_by_key = {(entry['function'], entry['size']): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        reference = baseline_by_key.get((entry['function'], entry['size']))
+        if reference is None:
+            continue
+        for metric in ('seconds', 'peak_memory_bytes'):
+            growth = entry[metric] - reference[metric]
+            if growth > reference[metric] * tolerance and growth > floors[metric]:
+                regressions.append(f'{entry["function"]} on {entry["size"]}: '
+                                   f'{metric} {entry[metric]} > baseline {reference[metric]}')
+    return regressions
+
+
+def main() -> None:
+    """Run benchmarks, save results and check them against the baseline
+    """
+    args = parser.parse_args()
+    output_path = args.output or PROJECT_ROOT.joinpath('benchmark_results.json')
+
+    try:
+        results = run_benchmarks(sizes=args.sizes, repeats=args.repeats, seed=args.seed)
+    except NotImplementedError as error:
+        print(f'{error}\nThe benchmark requires implemented laboratory works.')
+        exit(1)
+    with open(file=output_path, mode='w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=4)
+    print(f'Benchmark results could be found in: {output_path}')
+
+    if args.baseline is None:
+        return
+    with open(file=Path(args.baseline), mode='r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    floors = {'seconds': args.min_seconds, 'peak_memory_bytes': args.min_memory_bytes}
+    regressions = find_regressions(results, baseline, args.tolerance, floors)
+    if regressions:
+        print('\n'.join(regressions))
+        print('\nThe benchmark check was not successful! Check the regressions above.')
+    exit(bool(regressions))
+
+
+if __name__ == '__main__':
+    # Example usage:
+    # python tools/benchmarks/benchmark_lab_1.py \
+    # --sizes 1KB 1MB 10MB \
+    # --baseline benchmark_baseline.json
+    main()